@@ -1,111 +1,243 @@
-import nfl_data_py as nfl
 import pandas as pd
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import logging
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parquet row group sizes, larger groups for the (much bigger) play-by-play table
+ROW_GROUP_SIZE = 100_000
+PBP_ROW_GROUP_SIZE = 200_000
+
+# play-by-play columns used downstream, out of the ~370 nflfastR provides
+PBP_KEEP_COLS = [
+    "game_id", "play_id", "season", "season_type", "week",
+    "posteam", "defteam", "play_type", "down", "ydstogo", "yardline_100", "yards_gained",
+    "epa", "wpa", "wp", "success", "qb_epa", "air_epa", "yac_epa",
+    "pass", "rush", "complete_pass", "interception", "fumble_lost", "sack", "touchdown",
+    "passer_player_id", "passer_player_name",
+    "rusher_player_id", "rusher_player_name",
+    "receiver_player_id", "receiver_player_name"
+]
+
 class NFLDataCollector:
     """
     Collects performance data from nflfastR package
     """
 
-    def __init__(self, output_dir: str = "data/raw/performance"):
+    def __init__(self, output_dir: str = "data/raw/performance", ttl_days: int = 7):
+        """
+        Previously saved files younger than ttl_days are reused instead of re-downloaded
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_days = ttl_days
+
+    def _output_path(self, name: str, years: List[int], suffix: str = "") -> Path:
+        """
+        Parquet path for a dataset over years, named after every season so different year lists never share a file
+        """
+        seasons = "_".join(map(str, sorted(set(years))))
+        return self.output_dir / f"{name}_{seasons}{suffix}.parquet"
+
+    def _load_cached(self, output_path: Path, force: bool) -> Optional[pd.DataFrame]:
+        """
+        Read a previous download of output_path if it is fresher than ttl_days
+
+        Returns None when there's no usable copy or force is set
+        """
+        if force or not output_path.exists():
+            return None
+
+        age = time.time() - output_path.stat().st_mtime
+        if age >= self.ttl_days * 86_400:
+            return None
+
+        logger.info(f"Loading cached {output_path}")
+        return pd.read_parquet(output_path)
+
+    def _downcast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink column dtypes in place: float64 -> float32, ints to the smallest int that fits,
+        low cardinality strings (team, position, play_type, ...) -> category
 
-    def collect_play_by_play(self, years: List[int]) -> pd.DataFrame:
+        EPA style metrics carry ~3 decimals, well inside float32 precision
+        """
+        for col in df.select_dtypes(include="float64").columns:
+            df[col] = pd.to_numeric(df[col], downcast="float")
+
+        for col in df.select_dtypes(include="integer").columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            try:
+                if df[col].nunique() < 0.5 * len(df):
+                    df[col] = df[col].astype("category")
+            except TypeError: # unhashable values (lists, dicts), leave as is
+                continue
+
+        return df
+
+    def _save(self, df: pd.DataFrame, output_path: Path, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Write a DataFrame as zstd-compressed Parquet
+        """
+        df.to_parquet(
+            output_path,
+            index=False,
+            compression="zstd",
+            row_group_size=row_group_size,
+            use_dictionary=True
+        )
+
+    def _save_streamed(self, df: pd.DataFrame, output_path: Path, row_group_size: int = PBP_ROW_GROUP_SIZE):
+        """
+        Write a large DataFrame as zstd-compressed Parquet one row group at a time
+
+        Only one row group is converted to Arrow at once, rather than the whole table
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+        with pq.ParquetWriter(output_path, schema, compression="zstd", use_dictionary=True) as writer:
+            for start in range(0, len(df), row_group_size):
+                chunk = df.iloc[start:start + row_group_size]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+    def collect_play_by_play(self, years: List[int], force: bool = False, all_columns: bool = False) -> pd.DataFrame:
         """
         Collect play by play data with EPA
 
+        Only PBP_KEEP_COLS are kept unless all_columns is set (saved to a separate _full file)
+
         args:
         years: int
+        force: re-download even if a fresh copy is saved
+        all_columns: keep the full nflfastR schema, for debugging
 
         returns:
         pandas dataframe
         """
+        suffix = "_full" if all_columns else ""
+        output_path = self._output_path("pbp", years, suffix)
+        cached = self._load_cached(output_path, force)
+        if cached is not None:
+            return cached
 
         logger.info(f"Collecting play-by-play data for {years}")
 
-        pbp = nfl.import_pbp_data(years)
+        import nfl_data_py as nfl # heavy import, only paid when actually downloading
+
+        if all_columns:
+            pbp = nfl.import_pbp_data(years)
+        else:
+            pbp = nfl.import_pbp_data(years, columns=PBP_KEEP_COLS)
+            pbp = pbp[[col for col in PBP_KEEP_COLS if col in pbp.columns]]
+        pbp = self._downcast(pbp)
 
         # save the data files to the data folder
-        output_path = self.output_dir / f"pbp_{min(years)}_{max(years)}.parquet"
-        pbp.to_parquet(output_path)
+        self._save_streamed(pbp, output_path)
         logger.info(f"Saved {len(pbp):,} plays to {output_path}")
 
         return pbp
     
-    def collect_player_stats(self, years: List[int]) -> pd.DataFrame:
+    def collect_player_stats(self, years: List[int], force: bool = False) -> pd.DataFrame:
         """
         Collect seasonal player stats.
 
         ARGS:
         years: list of ints
+        force: re-download even if a fresh copy is saved
 
         RETURNS:
         pandas DataFrame
         """
+        output_path = self._output_path("player_stats", years)
+        cached = self._load_cached(output_path, force)
+        if cached is not None:
+            return cached
+
         logger.info(f"Collecting player stats for {years}")
 
+        import nfl_data_py as nfl
+
         stats = nfl.import_seasonal_data(years)
+        stats = self._downcast(stats)
 
         # Save
-        output_path = self.output_dir / f"player_stats_{min(years)}_{max(years)}.csv"
-        stats.to_csv(output_path, index=False)
+        self._save(stats, output_path)
         logger.info(f"Saved stats for {len(stats):,} player-seasons to {output_path}")
 
         return stats
     
-    def collect_rosters(self, years: List[int]) -> pd.DataFrame:
+    def collect_rosters(self, years: List[int], force: bool = False) -> pd.DataFrame:
         """
         Collect roster data (age, position, draft info)
 
         ARGS:
         years: List of int
+        force: re-download even if a fresh copy is saved
 
         RETURNS:
         pandas DataFrame 
         """
+        output_path = self._output_path("rosters", years)
+        cached = self._load_cached(output_path, force)
+        if cached is not None:
+            return cached
+
         logger.info(f"Collecting roster data for {years}...")
 
+        import nfl_data_py as nfl
+
         rosters = nfl.import_seasonal_rosters(years)
+        rosters = self._downcast(rosters)
 
         # Save, specify output path
-        output_path = self.output_dir / f"rosters_{min(years)}_{max(years)}.csv"
-        rosters.to_csv(output_path, index=False)
+        self._save(rosters, output_path)
         logger.info(f"Saved {len(rosters):,} roster entries to {output_path}")
 
         return rosters
     
-    def collect_injuries(self, years: List[int]) -> pd.DataFrame:
+    def collect_injuries(self, years: List[int], force: bool = False) -> pd.DataFrame:
         """
         Injury data on players
 
         ARGS:
         years: List[ints]
+        force: re-download even if a fresh copy is saved
 
         RETURNS:
         pandas DataFrame
         """
 
+        output_path = self._output_path("injuries", years)
+        cached = self._load_cached(output_path, force)
+        if cached is not None:
+            return cached
+
         logger.info(f"Collecting injury data for {years}...")
 
+        import nfl_data_py as nfl
+
         injuries = nfl.import_injuries(years)
+        injuries = self._downcast(injuries)
 
         # Save and export
-        output_path = self.output_dir / f"injuries_{min(years)}_{max(years)}.csv"
-        injuries.to_csv(output_path, index=False)
+        self._save(injuries, output_path)
         logger.info(f"Saved {len(injuries):,} injury reports to {output_path}")
 
         return injuries
     
-    def collect_all(self, years: List[int]=[2023, 2024, 2025]) -> dict:
+    def collect_all(self, years: List[int]=[2023, 2024, 2025], force: bool = False) -> dict:
         """
         ARGS:
         years: List[int], defaulted to 2023, 2024, 2025
+        force: re-download every dataset even if fresh copies are saved
         
         RETURNS:
         dict: 
@@ -117,10 +249,10 @@ class NFLDataCollector:
         logger.info("="*50)
 
         data = {
-            "pbp": self.collect_play_by_play(years),
-            "stats": self.collect_player_stats(years),
-            "injuries": self.collect_injuries(years),
-            "rosters": self.collect_rosters(years)
+            "pbp": self.collect_play_by_play(years, force=force),
+            "stats": self.collect_player_stats(years, force=force),
+            "injuries": self.collect_injuries(years, force=force),
+            "rosters": self.collect_rosters(years, force=force)
         }
 
         logger.info("All performance data collected successfully")
@@ -135,7 +267,7 @@ if __name__ == "__main__":
     print("\n" + "="*50)
     print("COLLECTION SUMMARY")
     print("="*50)
-    print(f"Play-by-play records: {len(data['pbp']):, }")
+    print(f"Play-by-play records: {len(data['pbp']):,}")
     print(f"Player stat records: {len(data['stats']):,}")
     print(f"Player Injury records: {len(data['injuries']):,}")
     print(f"Roster records: {len(data['rosters']):,}")
\ No newline at end of file
@@ -1,10 +1,18 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from pathlib import Path
 import time
+import random
+import threading
 import logging
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import List, Optional
+
+try:
+    import requests_cache
+except ImportError: # requests-cache is optional, pages are re-fetched every run without it
+    requests_cache = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,10 +37,102 @@ class OverTheCapScraper:
         "SEA": 'seattle-seahawks'
     }
 
-    def __init__(self, output_dir: str = "data/raw/contracts"):
+    # cap sheets change at most weekly
+    CACHE_EXPIRY = timedelta(days=3)
+
+    def __init__(self, output_dir: str = "data/raw/contracts", max_concurrency: int = 4):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+
+        # persistent HTTP cache across runs when requests-cache is installed
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name=str(self.output_dir / ".http_cache"),
+                backend="sqlite",
+                expire_after=self.CACHE_EXPIRY,
+                allowable_codes=(200,)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
              'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        })
\ No newline at end of file
+        })
+
+        # bounds in-flight requests across the scraping threads
+        self._request_slots = threading.Semaphore(max_concurrency)
+
+    def _get(self, url: str) -> requests.Response:
+        """
+        GET a page politely: at most max_concurrency requests in flight, with a little jitter after each
+        one that went to the network. Pages served from the HTTP cache return right away
+        """
+        with self._request_slots:
+            response = self.session.get(url, timeout=30)
+            if not getattr(response, "from_cache", False):
+                time.sleep(random.uniform(0.1, 0.3)) # hold the slot so the site sees spaced requests
+        response.raise_for_status()
+        return response
+
+    def scrape_team(self, team: str) -> pd.DataFrame:
+        """
+        Scrape the salary cap table for one team
+
+        ARGS:
+        team: team abbreviation, key of TEAM_SLUGS
+
+        RETURNS:
+        pandas DataFrame, one row per player contract
+        """
+        url = f"{self.BASE_URL}salary-cap/{self.TEAM_SLUGS[team]}"
+        logger.info(f"Scraping {team} contracts from {url}")
+
+        from bs4 import BeautifulSoup # imported here so the module loads without parsing deps
+
+        soup = BeautifulSoup(self._get(url).text, "html.parser")
+        table = soup.find("table")
+
+        if table is None:
+            logger.warning(f"No salary cap table found for {team}")
+            return pd.DataFrame()
+
+        headers = [th.get_text(strip=True) for th in table.find_all("th")]
+        rows = []
+        for tr in table.find_all("tr"):
+            cells = [td.get_text(strip=True) for td in tr.find_all("td")]
+            if len(cells) == len(headers):
+                rows.append(cells)
+
+        df = pd.DataFrame(rows, columns=headers)
+        df["team"] = team
+
+        return df
+
+    def scrape_all_teams(self, teams: Optional[List[str]] = None, max_workers: int = 8) -> pd.DataFrame:
+        """
+        Scrape every team in TEAM_SLUGS (or the given list) concurrently
+
+        Teams are fetched on a thread pool sharing self.session
+
+        ARGS:
+        teams: list of team abbreviations, defaults to all of TEAM_SLUGS
+        max_workers: number of scraping threads
+
+        RETURNS:
+        pandas DataFrame of all teams' contracts
+        """
+        teams = list(self.TEAM_SLUGS) if teams is None else teams
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(self.scrape_team, teams))
+
+        if not frames:
+            logger.warning("No teams to scrape")
+            return pd.DataFrame()
+
+        contracts = pd.concat(frames, ignore_index=True)
+
+        output_path = self.output_dir / "contracts.parquet"
+        contracts.to_parquet(output_path, index=False, compression="zstd")
+        logger.info(f"Saved {len(contracts):,} contracts for {len(teams)} teams to {output_path}")
+
+        return contracts
@@ -1,19 +1,28 @@
-import random
-from typing import List, Dict, Tuple, Callable
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import count, repeat
+from typing import List, Dict, Tuple, Callable, Optional, Union
 from dataclasses import dataclass, field
-from copy import deepcopy
+from types import MappingProxyType
 import numpy as np
-import pandas as pd
-from tqdm import tqdm
 
-from player_valuation import PlayerAsset, PlayerValuationModel, PortfolioAnalyzer
+try:
+    from numba import njit
+except ImportError: # numba is optional, kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda func: func
 
-@dataclass
+from player_valuation import PlayerAsset, PlayerValuationModel, PortfolioAnalyzer, POSITIONS, POS_INDEX, NUM_POS, MP_CONTEXT
+
+@dataclass(frozen=True)
 class RosterConstraints:
     """
     Setting up constraints for NFL active roster. Current active roster size is 53 players
 
     Base Salary Cap default value from https://overthecap.com/salary-cap-space
+
+    Immutable, the per-position arrays below are derived from position_limits once.
+    Use dataclasses.replace for a variant
     """
     max_roster_size: int = 53
     min_roster_size: int = 53
@@ -38,6 +47,35 @@ class RosterConstraints:
         'LS': (1, 1)
     })
 
+    def __post_init__(self):
+        unknown = set(self.position_limits) - set(POSITIONS)
+        if unknown:
+            raise ValueError(f"position_limits has unknown positions: {', '.join(sorted(unknown))}, expected keys from POSITIONS")
+
+        # read-only view of a private copy, so the limits can't drift from the arrays derived from them
+        limits = dict(self.position_limits)
+        set_attr = lambda name, value: object.__setattr__(self, name, value)
+        set_attr('position_limits', MappingProxyType(limits))
+
+        # (min, max) per position as arrays aligned with POSITIONS, positions without a limit are unbounded
+        min_arr = np.array([limits.get(p, (0, self.max_roster_size))[0] for p in POSITIONS], dtype=np.int64)
+        max_arr = np.array([limits.get(p, (0, self.max_roster_size))[1] for p in POSITIONS], dtype=np.int64)
+
+        # position balance terms: ideal count is the midpoint, score falls 0.5 from ideal to min/max
+        limited_arr = np.array([p in limits for p in POSITIONS])
+        ideal_arr = (min_arr + max_arr) / 2
+        max_dist = ideal_arr - min_arr
+        balance_scale_arr = np.divide(0.5, max_dist, out=np.zeros_like(max_dist), where=max_dist > 0)
+
+        for name, arr in (('min_arr', min_arr), ('max_arr', max_arr), ('limited_arr', limited_arr),
+                          ('ideal_arr', ideal_arr), ('balance_scale_arr', balance_scale_arr)):
+            arr.flags.writeable = False
+            set_attr(name, arr)
+
+    def __reduce__(self):
+        # the mappingproxy doesn't pickle, rebuild from the field values instead
+        return (type(self), (self.max_roster_size, self.min_roster_size, self.salary_cap, dict(self.position_limits)))
+
 class Chromosome:
     """
     Using the evolution algorithm, need to represent the chromosomes and genes.
@@ -49,8 +87,32 @@ class Chromosome:
 
     def __init__(self, players: List[PlayerAsset]):
         self.players = players
-        self.fitness = None,
+        self.fitness = None
+
+        # parallel arrays (SoA) of the values the hot fitness path reads
+        self.cap_hits = np.fromiter((p.cap_hit_2026 for p in players), dtype=np.float64, count=len(players))
+        self.pos_codes = np.fromiter((POS_INDEX[p.position] for p in players), dtype=np.int8, count=len(players))
+        self.expected_values = np.fromiter((p.expected_value for p in players), dtype=np.float64, count=len(players))
+        self.risk_scores = np.fromiter((p.risk_score for p in players), dtype=np.float64, count=len(players))
+        self._shared_arrays = False # True while the SoA arrays are shared with the chromosome this was cloned from
+        self._reset_caches()
+
+    def _reset_caches(self):
+        """
+        Drop everything derived from the roster, must run whenever players change
+        """
         self._analyzer = None
+        self._by_pos = None
+        self._total_cap = None
+        self._counts = None
+        self._pos_counts = None
+        self._pool_idx = None # (engine pool id, indices into that engine's player pool), set by the engine
+
+    def __getstate__(self):
+        # the analyzer is rebuilt lazily, no need to pickle its DataFrame
+        state = self.__dict__.copy()
+        state['_analyzer'] = None
+        return state
 
     def __len__(self):
         return len(self.players)
@@ -58,28 +120,73 @@ class Chromosome:
     @property
     def analyzer(self) -> PortfolioAnalyzer:
         """
-        Load analzyer lazily
+        Load analyzer lazily
         """
         if self._analyzer is None:
             self._analyzer = PortfolioAnalyzer(self.players)
         return self._analyzer
     
+    @property
+    def by_pos(self) -> List[List[PlayerAsset]]:
+        """
+        Players grouped by position, indexed by position code. Built lazily
+        """
+        if self._by_pos is None:
+            self._by_pos = [[] for _ in POSITIONS]
+            for player, code in zip(self.players, self.pos_codes):
+                self._by_pos[code].append(player)
+        return self._by_pos
+
     def total_cap(self) -> float:
         """
         Total Cap hit of roster as a float
         """
-        return sum(p.cap_hit_2026 for p in self.players)
+        if self._total_cap is None:
+            self._total_cap = float(self.cap_hits.sum())
+        return self._total_cap
     
+    def pos_counts_array(self) -> np.ndarray:
+        """
+        Count players by position as an array aligned with POSITIONS, cached so treat as read-only
+        """
+        if self._counts is None:
+            self._counts = np.bincount(self.pos_codes, minlength=NUM_POS)
+        return self._counts
+
     def position_counts(self) -> Dict[str, int]:
         """
         Count players by position
 
         Returns a dictionary with player pos as key, count of players by position as int as value
         """
-        counts = {}
-        for player in self.players:
-            counts[player.position] = counts.get(player.position, 0) + 1 # if position key doesn't exist yet, return 0
-        return counts
+        if self._pos_counts is None:
+            counts = self.pos_counts_array()
+            self._pos_counts = {POSITIONS[i]: int(count) for i, count in enumerate(counts) if count > 0}
+        return dict(self._pos_counts) # a copy, the cached dict is shared with clones
+
+    def fingerprint(self) -> frozenset:
+        """
+        Order independent identity of the roster, used as the fitness cache key
+        """
+        return frozenset(p.player_id for p in self.players)
+
+    def replace_player(self, idx: int, player: PlayerAsset):
+        """
+        Put player into roster slot idx, keeping the SoA arrays in sync
+        """
+        if self._shared_arrays: # copy-on-write, the first change after clone() takes private arrays
+            self.cap_hits = self.cap_hits.copy()
+            self.pos_codes = self.pos_codes.copy()
+            self.expected_values = self.expected_values.copy()
+            self.risk_scores = self.risk_scores.copy()
+            self._shared_arrays = False
+
+        self.players[idx] = player
+        self.cap_hits[idx] = player.cap_hit_2026
+        self.pos_codes[idx] = POS_INDEX[player.position]
+        self.expected_values[idx] = player.expected_value
+        self.risk_scores[idx] = player.risk_score
+        self._reset_caches()
     
     def is_valid(self, constraints: RosterConstraints) -> bool:
         """
@@ -96,34 +203,182 @@ class Chromosome:
             return False
         
         # Check position requirements
-        pos_counts = self.position_counts()
-        for position, (min_count, max_count) in constraints.position_limits.items():
-            count = pos_counts.get(position, 0)
-            if count < min_count or count > max_count:
-                return False
+        counts = self.pos_counts_array()
+        if (counts < constraints.min_arr).any() or (counts > constraints.max_arr).any():
+            return False
         
         return True
     
     def clone(self) -> 'Chromosome':
         """
-        Creates a deep copy of the Chromosome instance
+        Creates a copy of the Chromosome instance
+
+        PlayerAsset instances are treated as immutable within a GA run, so the clone
+        shares them with the original and only the roster list is copied. The SoA arrays are
+        shared too, replace_player copies them on either side before the first write
         """
-        return Chromosome([deepcopy(p) for p in self.players])
+        new = Chromosome.__new__(Chromosome)
+        new.players = self.players.copy()
+        new.fitness = None
+        new.cap_hits = self.cap_hits
+        new.pos_codes = self.pos_codes
+        new.expected_values = self.expected_values
+        new.risk_scores = self.risk_scores
+        new._shared_arrays = self._shared_arrays = True
+        new._reset_caches()
+
+        # same roster, so the cheap aggregates carry over
+        new._total_cap = self._total_cap
+        new._counts = self._counts
+        new._pos_counts = self._pos_counts
+        new._pool_idx = self._pool_idx
+        return new
+
+@njit(cache=True, fastmath=True)
+def _fitness_kernel(cap_hits, pos_codes, expected_values, risk_scores,
+                    min_arr, max_arr, ideal_arr, balance_scale_arr, limited_arr, salary_cap):
+    """
+    Fitness math of score_chromosome over a chromosome's SoA arrays, compiled by numba when available
+    """
+    total_cap = 0.0
+    total_value = 0.0
+    weighted_risk = 0.0
+    counts = np.zeros(len(min_arr), dtype=np.int64)
+
+    for i in range(len(cap_hits)):
+        total_cap += cap_hits[i]
+        total_value += expected_values[i]
+        weighted_risk += risk_scores[i] * cap_hits[i]
+        counts[pos_codes[i]] += 1
+
+    # 1. Portfolio Efficiency (value per dollar)
+    efficiency = total_value / total_cap if total_cap > 0 else 0.0
+    efficiency_score = min(efficiency / 1.5, 1.0)
+
+    # 2. Risk score (cap weighted, lower is better)
+    risk = weighted_risk / total_cap if total_cap > 0 else 0.0
+    risk_score = 1 - risk # invert to make higher better
+
+    # 3. Position balance, see position_balance
+    balance_total = 0.0
+    n_limited = 0
+    for pi in range(len(min_arr)):
+        if not limited_arr[pi]:
+            continue
+        n_limited += 1
+        if min_arr[pi] <= counts[pi] <= max_arr[pi]:
+            balance_total += 1 - abs(counts[pi] - ideal_arr[pi]) * balance_scale_arr[pi]
+    balance_score = balance_total / n_limited if n_limited > 0 else 0.0
+
+    # 4. Cap space utilization (use cap efficiently, but leave some breathing room)
+    utilization = total_cap / salary_cap
+
+    if 0.90 <= utilization <= 0.95:
+        cap_score = 1.0
+    elif utilization <= 0.90:
+        cap_score = utilization / 0.90 # penalize for underutilization
+    else:
+        cap_score = max(0.0, 2 - utilization / 0.95) # penalize for overutilization
+
+    # weighted combination based on calculations in method and arbitrary weights in objectives
+    return (
+        0.40 * efficiency_score +
+        0.25 * risk_score +
+        0.20 * balance_score +
+        0.15 * cap_score
+    )
+
+# specialized fitness kernels by the constraint values baked into them, see specialize_fitness_kernel
+_specialized_kernels: Dict[tuple, Callable] = {}
+
+def specialize_fitness_kernel(constraints: RosterConstraints) -> Callable:
+    """
+    _fitness_kernel with one set of constraints bound in
+
+    The constraint arrays and salary cap are closure constants, which numba freezes into the compiled
+    function, so one engine's fitness calls only pass the chromosome's arrays.
+    Closures can't use the on-disk cache, so kernels are compiled once per process for each distinct
+    set of constraint values and reused by every engine with the same values.
+    score_chromosome stays the picklable generic path
+    """
+    key = (float(constraints.salary_cap), constraints.min_arr.tobytes(),
+           constraints.max_arr.tobytes(), constraints.limited_arr.tobytes())
+    if key in _specialized_kernels:
+        return _specialized_kernels[key]
+
+    min_arr, max_arr, ideal_arr = constraints.min_arr, constraints.max_arr, constraints.ideal_arr
+    balance_scale_arr, limited_arr = constraints.balance_scale_arr, constraints.limited_arr
+    salary_cap = float(constraints.salary_cap)
+
+    @njit(fastmath=True)
+    def kernel(cap_hits, pos_codes, expected_values, risk_scores):
+        return _fitness_kernel(cap_hits, pos_codes, expected_values, risk_scores,
+                               min_arr, max_arr, ideal_arr, balance_scale_arr, limited_arr, salary_cap)
+
+    # compile now rather than on the first generation
+    empty = np.empty(0, dtype=np.float64)
+    kernel(empty, np.empty(0, dtype=np.int8), empty, empty)
+
+    _specialized_kernels[key] = kernel
+    return kernel
+
+def score_chromosome(chromosome: Chromosome, constraints: RosterConstraints) -> float:
+    """
+    multi-objective fitness of a roster, see EvolutionEngine.fitness_function
+    """
+    if not chromosome.is_valid(constraints):
+        return -1000 # invalid rosters are definitionally not evolutionary fit
+
+    return score_arrays(
+        (chromosome.cap_hits, chromosome.pos_codes, chromosome.expected_values, chromosome.risk_scores),
+        constraints
+    )
+
+def score_arrays(arrays: Tuple[np.ndarray, ...], constraints: RosterConstraints) -> float:
+    """
+    Fitness of a valid roster from its SoA arrays (cap hits, position codes, expected values, risk scores)
+
+    Module level (not a method) so it can be pickled and run on worker processes,
+    which then receive only the arrays rather than the chromosome and its players
+    """
+    cap_hits, pos_codes, expected_values, risk_scores = arrays
+    return float(_fitness_kernel(
+        cap_hits, pos_codes, expected_values, risk_scores,
+        constraints.min_arr, constraints.max_arr, constraints.ideal_arr,
+        constraints.balance_scale_arr, constraints.limited_arr, float(constraints.salary_cap)
+    ))
+
+def position_balance(chromosome: Chromosome, constraints: RosterConstraints) -> float:
+    """
+    How well does a roster meet positional needs?
+
+    Scored between 0.0-1.0, higher being better.
+    """
+    counts = chromosome.pos_counts_array()
+
+    # 0 outside (min, max), linear score from 1.0 at ideal to 0.5 at min/max
+    in_range = (counts >= constraints.min_arr) & (counts <= constraints.max_arr)
+    scores = (1 - np.abs(counts - constraints.ideal_arr) * constraints.balance_scale_arr) * in_range
+
+    scores = scores[constraints.limited_arr]
+    return float(scores.mean()) if len(scores) > 0 else 0
 
 class EvolutionEngine:
     """
     Genetic algorithm for roster optimization
     
     """
+    _pool_ids = count()
+
     def __init__(self,
                  current_roster: List[PlayerAsset],
                  available_players: List[PlayerAsset],
                  constraints: RosterConstraints,
-                 valuation_model: PlayerValuationModel):
+                 valuation_model: PlayerValuationModel,
+                 seed: Optional[Union[int, np.random.SeedSequence]] = None):
         
         self.current_roster = current_roster
         self.available_players = available_players
-        self.constraints = constraints
         self.valuation_model = valuation_model
 
         # Evolutionary Parameters, generic for now to test out evo engine
@@ -133,12 +388,69 @@ class EvolutionEngine:
         self.crossover_rate = 0.8
         self.tournament_size = 5
         self.elitism_count = 5
+        self.n_workers = 1 # > 1 scores each generation on a process pool
+
+        # single RNG stream for every random decision, seed (an int or a SeedSequence,
+        # e.g. one of SeedSequence(entropy).spawn(n) for independent runs) for reproducible runs
+        self.rng = np.random.default_rng(seed)
 
         # History Tracking
         self.history = []
         self.best_ever = None
         self.best_fitness_ever = -float('inf')
 
+        # Fitness memo keyed by fitness_key, bounded LRU
+        self.fitness_cache_size = 10_000
+        self._fitness_cache: OrderedDict = OrderedDict()
+
+        # after the cache exists, the setter also picks up the fitness kernel specialized to these constraints
+        self.constraints = constraints
+
+        # global player pool: available players first, then any current roster players not among them.
+        # rosters are handled as index arrays / boolean masks over the pool for membership tests
+        self.pool: List[PlayerAsset] = []
+        self._pool_id = next(self._pool_ids) # tags pool indices cached on chromosomes, see roster_indices
+        self._pool_index: Dict[str, int] = {}
+        def add_to_pool(players: List[PlayerAsset]):
+            for player in players:
+                if player.player_id not in self._pool_index:
+                    self._pool_index[player.player_id] = len(self.pool)
+                    self.pool.append(player)
+
+        add_to_pool(available_players)
+        n_available = len(self.pool) # unique available players, repeated ids count once
+        add_to_pool(current_roster)
+
+        self.pool_pos = np.fromiter((POS_INDEX[p.position] for p in self.pool), dtype=np.int8, count=len(self.pool))
+        self.pool_cap = np.fromiter((p.cap_hit_2026 for p in self.pool), dtype=np.float64, count=len(self.pool))
+        self.pool_ev = np.fromiter((p.expected_value for p in self.pool), dtype=np.float64, count=len(self.pool))
+
+        # pool indices of available players per position code, in available_players order
+        self._pool_by_pos = [np.flatnonzero(self.pool_pos[:n_available] == pi) for pi in range(NUM_POS)]
+
+        # available players per position code, cheapest first
+        self._available_by_pos: List[List[PlayerAsset]] = [[] for _ in POSITIONS]
+        for player in sorted(self.pool[:n_available], key=lambda p: p.cap_hit_2026):
+            self._available_by_pos[POS_INDEX[player.position]].append(player)
+
+
+        # how often _repair turned an invalid offspring into a valid one
+        self.repair_stats = {'repaired': 0, 'failed': 0}
+
+    @property
+    def constraints(self) -> RosterConstraints:
+        """
+        Roster constraints, assigning new ones swaps in their specialized fitness kernel
+        and clears the fitness cache, whose scores no longer apply
+        """
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: RosterConstraints):
+        self._constraints = constraints
+        self._fitness_kernel = specialize_fitness_kernel(constraints)
+        self._fitness_cache.clear()
+
     def fitness_function(self, chromosome: Chromosome) -> float:
         """
         multi-objective fitness function
@@ -148,45 +460,95 @@ class EvolutionEngine:
         2. Minimize portfolio risk (25%)
         3. Maximize position balance (20%)
         4. Minimize wasted cap space (15%)
+
+        Results are cached by fitness_key, so unchanged rosters carried over
+        between generations (elites, un-crossed clones) are not rescored
         """
+        key = self.fitness_key(chromosome)
+        cache = self._fitness_cache
 
-        if not chromosome.is_valid(self.constraints):
-            return -1000 # invalid rosters are definitionally not evolutionary fit
-        
-        analyzer = chromosome.analyzer
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
 
-        # 1. Portfolio Efficiency (value per dollar)
-        efficiency = analyzer.portfolio_efficiency()
-        efficiency_score = min(efficiency / 1.5, 1.0)
+        fitness = self._evaluate_fitness(chromosome)
+        self._cache_fitness(key, fitness)
 
-        # 2. Risk score (lower is better)
-        risk = analyzer.portfolio_risk()
-        risk_score = 1 - risk # invert to make higher better
+        return fitness
 
-        # 3. Position balance (ensures not optimizing for single position, eg. 10 WR's')
-        position_balance = self._calculate_position_balance(chromosome)
+    def fitness_key(self, chromosome: Chromosome):
+        """
+        Order independent identity of the roster for the fitness cache: the bytes of its sorted pool indices,
+        reusing the index array mutation already caches on the chromosome.
+        Rosters with players outside the pool fall back to the player_id fingerprint
+        """
+        idx = self.roster_indices(chromosome)
+        if len(idx) != len(chromosome.players):
+            return chromosome.fingerprint()
+        return np.sort(idx).tobytes()
 
-        # 4. Cap space utilization (use cap efficiently, but leave some breathing room)
-        cap_used = chromosome.total_cap()
-        cap_available = self.constraints.salary_cap
-        utilization = cap_used / cap_available
+    def _cache_fitness(self, key, fitness: float):
+        """
+        Store a score in the fitness cache, evicting the least recently used entry when full
+        """
+        self._fitness_cache[key] = fitness
+        if len(self._fitness_cache) > self.fitness_cache_size:
+            self._fitness_cache.popitem(last=False)
 
-        if 0.90 <= utilization <= 0.95:
-            cap_score = 1.0
-        elif utilization <= 0.90:
-            cap_score = utilization / 0.90 # penalize for underutilization
-        else:
-            cap_score = max(0, 2 - utilization / 0.95) # penalize for overutilization
+    def _evaluate_fitness(self, chromosome: Chromosome) -> float:
+        """
+        Uncached fitness computation, see fitness_function. Same result as score_chromosome,
+        through the kernel specialized to this engine's constraints
+        """
+        if not chromosome.is_valid(self.constraints):
+            return -1000
 
-        # weighted combination based on calculations in method and arbitrary weights in objectives
-        fitness = (
-            0.40 * efficiency_score +
-            0.25 * risk_score +
-            0.20 * position_balance +
-            0.15 * cap_score
-        )
+        return float(self._fitness_kernel(
+            chromosome.cap_hits, chromosome.pos_codes, chromosome.expected_values, chromosome.risk_scores
+        ))
 
-        return fitness
+    def evaluate_population(self, population: List[Chromosome], pool: Optional[Executor] = None) -> List[float]:
+        """
+        Fitness of every chromosome in population, sets chromosome.fitness as a side effect
+
+        Cache misses are scored on pool when one is given, otherwise in this process
+        """
+        cache = self._fitness_cache
+        keys = [self.fitness_key(c) for c in population]
+
+        # scores for this batch, starting from cache hits
+        scored = {}
+        misses = {}
+        for key, chromosome in zip(keys, population):
+            if key in scored or key in misses:
+                continue
+            if key in cache:
+                cache.move_to_end(key)
+                scored[key] = cache[key]
+            else:
+                misses[key] = chromosome
+
+        if misses:
+            if pool is None:
+                scores = [self._evaluate_fitness(c) for c in misses.values()]
+            else:
+                # validity is cheap and cached on the chromosome, workers only score the valid rosters' arrays
+                valid = [c.is_valid(self.constraints) for c in misses.values()]
+                arrays = [(c.cap_hits, c.pos_codes, c.expected_values, c.risk_scores)
+                          for c, ok in zip(misses.values(), valid) if ok]
+                chunksize = max(1, len(arrays) // (4 * self.n_workers))
+                valid_scores = iter(pool.map(score_arrays, arrays, repeat(self.constraints), chunksize=chunksize))
+                scores = [next(valid_scores) if ok else -1000 for ok in valid]
+            for key, fitness in zip(misses, scores):
+                scored[key] = fitness
+                self._cache_fitness(key, fitness)
+
+        fitness_scores = []
+        for key, chromosome in zip(keys, population):
+            chromosome.fitness = scored[key]
+            fitness_scores.append(scored[key])
+
+        return fitness_scores
 
     def _calculate_position_balance(self, chromosome: Chromosome) -> float:
         """
@@ -194,34 +556,7 @@ class EvolutionEngine:
 
         Scored between 0.0-1.0, higher being better.
         """
-        pos_counts = chromosome.position_counts()
-
-        total_score = 0
-        total_positions = 0
-
-        for position, (min_count, max_count) in self.constraints.position_limits.items():
-            count = pos_counts.get(position, 0)
-
-            # ideal count is midpoint
-            ideal_count = (min_count + max_count) / 2
-
-            # score based on distance from ideal
-            if count < min_count:
-                score = 0 # below minimum is bad situation
-            elif count > max_count:
-                score = 0 # above maximum bad as well
-            else:
-                # linear score: 1.0 at ideal, 0.5 at min/max
-                distance_from_ideal = abs(count - ideal_count)
-                max_distance = ideal_count - min_count
-                if max_distance > 0:
-                    score = 1 - (distance_from_ideal / max_distance) *0.5
-                else:
-                    score = 1.0
-            total_score += score
-            total_positions += 1
-
-        return total_score / total_positions if total_positions > 0 else 0
+        return position_balance(chromosome, self.constraints)
     
     def initialize_population(self) -> List[Chromosome]:
         """
@@ -238,6 +573,8 @@ class EvolutionEngine:
         attempts = 0
         max_attempts = 10_000
 
+        from tqdm import tqdm # imported here so importing the engine stays cheap
+
         with tqdm(total=self.population_size, desc="Initializing population") as pbar:
             while len(population) < self.population_size and attempts < max_attempts:
                 roster = self._generate_random_roster()
@@ -267,7 +604,7 @@ class EvolutionEngine:
         cap_used = 0
 
         available = self.available_players.copy()
-        random.shuffle(available)
+        self.rng.shuffle(available)
 
         for player in available:
             pos = player.position
@@ -285,52 +622,80 @@ class EvolutionEngine:
                 cap_used += player.cap_hit_2026
 
         # fill missing positions with cheap options
+        roster_ids = {p.player_id for p in roster}
         for pos, (min_count, _) in self.constraints.position_limits.items():
-            while positions_filled[pos] < min_count:
-                # find cheapest players to fill until min count satisfied
-                candidates = [p for p in available if p.position == pos and p not in roster]
-                if candidates:
-                    cheapest = min(candidates, key=lambda p: p.cap_hit_2026)
-                    if cap_used + cheapest.cap_hit_2026 <= self.constraints.salary_cap:
-                        roster.append(cheapest)
-                        positions_filled[pos] += 1
-                        cap_used += cheapest.cap_hit_2026
-                    else:
-                        break
-                else:
+            # candidates are pre-sorted cheapest first
+            for cheapest in self._available_by_pos[POS_INDEX[pos]]:
+                if positions_filled[pos] >= min_count:
                     break
+                if cheapest.player_id in roster_ids:
+                    continue
+                if cap_used + cheapest.cap_hit_2026 > self.constraints.salary_cap:
+                    break # every remaining candidate costs at least as much
+                roster.append(cheapest)
+                roster_ids.add(cheapest.player_id)
+                positions_filled[pos] += 1
+                cap_used += cheapest.cap_hit_2026
 
         return roster
     
-    def tournament_selection(self, population: List[Chromosome], fitness_scores: List[float]) -> Chromosome:
+    def tournament_selection(self,
+                             population: List[Chromosome],
+                             fitness_scores: List[float],
+                             tournament_indices: Optional[np.ndarray] = None) -> Chromosome:
         """
         Select parent using tournament selection
 
         args:
         population: List[Chromosome]'
         fitness_scores: List[floats]
+        tournament_indices: pre-drawn contestant indices, drawn from self.rng if None
 
         returns:
         Chromosome
         """
-        tournament_indices = random.sample(range(len(population)), min(self.tournament_size, len(population)))
+        if tournament_indices is None:
+            tournament_indices = self.rng.integers(0, len(population), self.tournament_size)
 
-        best_idx = max(tournament_indices, key=lambda i: fitness_scores[i])
+        best_idx = tournament_indices[np.argmax(np.asarray(fitness_scores)[tournament_indices])]
 
         return population[best_idx]
+
+    def tournament_winners(self, fitness: np.ndarray, n_pairs: int) -> np.ndarray:
+        """
+        Run 2 * n_pairs tournaments at once
+
+        args:
+        fitness: np.ndarray of population fitness scores
+        n_pairs: number of parent pairs to select
+
+        returns:
+        np.ndarray of population indices, shape (n_pairs, 2)
+        """
+        contestants = self.rng.integers(0, len(fitness), (2 * n_pairs, self.tournament_size))
+        winners = contestants[np.arange(2 * n_pairs), fitness[contestants].argmax(axis=1)]
+
+        return winners.reshape(n_pairs, 2)
     
-    def crossover(self, parent1: Chromosome, parent2: Chromosome) -> Tuple[Chromosome, Chromosome]:
+    def crossover(self,
+                  parent1: Chromosome,
+                  parent2: Chromosome,
+                  draws: Optional[np.ndarray] = None) -> Tuple[Chromosome, Chromosome]:
         """
         Creates two offspring by combining parents.
 
         Args:
         parent1: Chromosome
         parent2: Chromosome
+        draws: 1 + NUM_POS pre-drawn uniforms (crossover coin, then one per position), drawn from self.rng if None
 
         Returns:
         Tuple of Chromosomes
         """
-        if random.random() > self.crossover_rate:
+        if draws is None:
+            draws = self.rng.random(1 + NUM_POS)
+
+        if draws[0] > self.crossover_rate:
             # no crossover, return clones
             return parent1.clone(), parent2.clone()
         
@@ -338,87 +703,194 @@ class EvolutionEngine:
         child1_players = []
         child2_players = []
 
-        all_positions = set(self.constraints.position_limits.keys())
+        p1_by_pos = parent1.by_pos
+        p2_by_pos = parent2.by_pos
+        take_p1 = draws[1:] < 0.5
 
-        for position in all_positions:
-            p1_at_pos = [p for p in parent1.players if p.position == position]
-            p2_at_pos = [p for p in parent2.players if p.position == position]
-
-            if random.random() < 0.5:
-                child1_players.extend(p1_at_pos)
-                child2_players.extend(p2_at_pos)
+        for pi in range(NUM_POS):
+            if take_p1[pi]:
+                child1_players.extend(p1_by_pos[pi])
+                child2_players.extend(p2_by_pos[pi])
             else:
-                child1_players.extend(p2_at_pos)
-                child2_players.extend(p1_at_pos)
+                child1_players.extend(p2_by_pos[pi])
+                child2_players.extend(p1_by_pos[pi])
 
         return Chromosome(child1_players), Chromosome(child2_players)
     
-    def mutate(self, chromosome: Chromosome) -> Chromosome:
+    def _repair(self, chromosome: Chromosome) -> Chromosome:
+        """
+        Push an invalid offspring back inside the roster constraints
+
+        1. Trim positions above max, dropping lowest expected value first
+        2. Backfill positions below min with the cheapest available players
+        3. Trim or backfill to the roster size, staying inside position limits
+        4. While over the cap, swap the worst value per dollar players for cheaper ones
+
+        Valid chromosomes are returned unchanged. Returns a new Chromosome otherwise
+        """
+        constraints = self.constraints
+        if chromosome.is_valid(constraints):
+            return chromosome
+
+        groups = [sorted(g, key=lambda p: p.expected_value, reverse=True) for g in chromosome.by_pos]
+        roster_ids = {p.player_id for p in chromosome.players}
+
+        def cheapest_free(pi: int) -> Optional[PlayerAsset]:
+            for player in self._available_by_pos[pi]:
+                if player.player_id not in roster_ids:
+                    return player
+            return None
+
+        def add(pi: int, player: PlayerAsset):
+            groups[pi].append(player)
+            roster_ids.add(player.player_id)
+
+        def drop_last(pi: int):
+            roster_ids.discard(groups[pi].pop().player_id)
+
+        # 1 + 2. position limits
+        for pi in range(NUM_POS):
+            while len(groups[pi]) > constraints.max_arr[pi]:
+                drop_last(pi)
+            while len(groups[pi]) < constraints.min_arr[pi]:
+                player = cheapest_free(pi)
+                if player is None:
+                    break
+                add(pi, player)
+
+        # 3. roster size
+        size = sum(len(g) for g in groups)
+        while size > constraints.max_roster_size:
+            droppable = [pi for pi in range(NUM_POS) if len(groups[pi]) > constraints.min_arr[pi]]
+            if not droppable:
+                break
+            drop_last(min(droppable, key=lambda pi: groups[pi][-1].expected_value))
+            size -= 1
+        while size < constraints.min_roster_size:
+            fillers = [(pi, cheapest_free(pi)) for pi in range(NUM_POS) if len(groups[pi]) < constraints.max_arr[pi]]
+            fillers = [(pi, p) for pi, p in fillers if p is not None]
+            if not fillers:
+                break
+            pi, player = min(fillers, key=lambda f: f[1].cap_hit_2026)
+            add(pi, player)
+            size += 1
+
+        # 4. salary cap
+        players = [p for g in groups for p in g]
+        cap_used = sum(p.cap_hit_2026 for p in players)
+        if cap_used > constraints.salary_cap:
+            by_value = sorted(range(len(players)),
+                              key=lambda i: players[i].expected_value / max(players[i].cap_hit_2026, 1))
+            for i in by_value:
+                if cap_used <= constraints.salary_cap:
+                    break
+                old_player = players[i]
+                new_player = cheapest_free(POS_INDEX[old_player.position])
+                if new_player is None or new_player.cap_hit_2026 >= old_player.cap_hit_2026:
+                    continue
+                roster_ids.discard(old_player.player_id)
+                roster_ids.add(new_player.player_id)
+                players[i] = new_player
+                cap_used += new_player.cap_hit_2026 - old_player.cap_hit_2026
+
+        repaired = Chromosome(players)
+        if repaired.is_valid(constraints):
+            self.repair_stats['repaired'] += 1
+        else:
+            self.repair_stats['failed'] += 1
+
+        return repaired
+
+    def roster_indices(self, chromosome: Chromosome) -> np.ndarray:
+        """
+        Pool indices of the chromosome's players, cached on the chromosome
+
+        The cache is tagged with this engine's pool id, indices computed by another engine's pool are recomputed.
+        Players outside the pool are left out
+        """
+        cached = chromosome._pool_idx
+        if cached is None or cached[0] != self._pool_id:
+            idx = [self._pool_index.get(p.player_id, -1) for p in chromosome.players]
+            idx = np.array(idx, dtype=np.int32)
+            cached = chromosome._pool_idx = (self._pool_id, idx[idx >= 0])
+        return cached[1]
+
+    def roster_mask(self, chromosome: Chromosome) -> np.ndarray:
+        """
+        Boolean mask over the pool, True for players on the chromosome's roster
+        """
+        mask = np.zeros(len(self.pool), dtype=bool)
+        mask[self.roster_indices(chromosome)] = True
+        return mask
+
+    def mutate(self, chromosome: Chromosome, draws: Optional[np.ndarray] = None) -> Chromosome:
         """
         Randomly mutate roster
 
         args:
         Chromosome
+        draws: 2 pre-drawn uniforms (mutation coin, mutation type), drawn from self.rng if None
 
         returns:
         Chromosome
         """
-        if random.random() > self.mutation_rate:
+        if draws is None:
+            draws = self.rng.random(2)
+
+        if draws[0] > self.mutation_rate:
             return chromosome
         
         mutated = chromosome.clone()
 
         # choose mutation type
-        mutation_type = random.choice(['swap', 'replace', 'upgrade'])
+        mutation_type = ('swap', 'replace', 'upgrade')[min(int(draws[1] * 3), 2)]
 
         if mutation_type == 'swap' and len(mutated.players) >= 2:
-            positions = list(set(p.position for p in mutated.players))
-            if positions:
-                pos = random.choice(positions)
-                players_at_pos = [i for i, p in enumerate(mutated.players) if p.position == pos]
+            positions = np.unique(mutated.pos_codes) # sorted, so a seeded run is repeatable
+            if len(positions) > 0:
+                pos = positions[self.rng.integers(len(positions))]
+                players_at_pos = np.flatnonzero(mutated.pos_codes == pos)
 
                 if len(players_at_pos) >= 2:
-                    idx1, idx2 = random.sample(players_at_pos, 2)
-                    mutated.players[idx1], mutated.players[idx2] = mutated.players[idx2], mutated.players[idx1]
+                    idx1, idx2 = self.rng.choice(players_at_pos, 2, replace=False)
+                    player1, player2 = mutated.players[idx1], mutated.players[idx2]
+                    mutated.replace_player(idx1, player2)
+                    mutated.replace_player(idx2, player1)
         elif mutation_type == 'replace' and len(mutated.players) > 0:
-            idx = random.randint(0, len(mutated.players)-1)
+            idx = self.rng.integers(len(mutated.players))
             old_player = mutated.players[idx]
 
-            # find replacements
-            candidates = [p for p in self.available_players
-                          if p.position == old_player.position
-                          and p.player_id != old_player.player_id
-                          and p not in mutated.players]
+            # find replacements, same position and not already on the roster (which excludes old_player)
+            candidates = self._pool_by_pos[POS_INDEX[old_player.position]]
+            candidates = candidates[~self.roster_mask(mutated)[candidates]]
 
-            if candidates:
-                new_player = random.choice(candidates)
+            if len(candidates) > 0:
+                new_player = self.pool[candidates[self.rng.integers(len(candidates))]]
 
                 # checking if swap maintains cap compliance
                 cap_diff = new_player.cap_hit_2026 - old_player.cap_hit_2026
                 if mutated.total_cap() + cap_diff <= self.constraints.salary_cap:
-                    mutated.players[idx] = new_player
+                    mutated.replace_player(idx, new_player)
         elif mutation_type == 'upgrade' and len(mutated.players) > 0:
             # Try to upgrade a player (higher value, but similar cost)
-            idx = random.randint(0, len(mutated.players) - 1)
+            idx = self.rng.integers(len(mutated.players))
             old_player = mutated.players[idx]
 
             # Find better players at position w/in +20% cap hit
             max_cap = old_player.cap_hit_2026 * 1.2
-            candidates = [
-                p for p in self.available_players
-                if p.position == old_player.position
-                and p.player_id != old_player.player_id
-                and p not in mutated.players
-                and p.cap_hit_2026 <= max_cap
-                and p.expected_value > old_player.expected_value
+            candidates = self._pool_by_pos[POS_INDEX[old_player.position]]
+            candidates = candidates[
+                ~self.roster_mask(mutated)[candidates]
+                & (self.pool_cap[candidates] <= max_cap)
+                & (self.pool_ev[candidates] > old_player.expected_value)
             ]
 
-            if candidates:
-                new_player = max(candidates, key=lambda p: p.expected_value)
+            if len(candidates) > 0:
+                new_player = self.pool[candidates[np.argmax(self.pool_ev[candidates])]]
                 cap_diff = new_player.cap_hit_2026 - old_player.cap_hit_2026
 
                 if mutated.total_cap() + cap_diff <= self.constraints.salary_cap:
-                    mutated.players[idx] = new_player
+                    mutated.replace_player(idx, new_player)
 
         return mutated
     
@@ -436,14 +908,28 @@ class EvolutionEngine:
         # initialize population
         population = self.initialize_population()
 
-        # evolution loop
+        pool = None
+        if self.n_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=MP_CONTEXT)
+
+        try:
+            self._evolve_loop(population, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        print(f"Praise Darwin! Evolution Complete")
+        print(f"Best fitness achieved: {self.best_fitness_ever:.4f}")
+
+        return self.best_ever, self.history
+
+    def _evolve_loop(self, population: List[Chromosome], pool: Optional[Executor]):
+        """
+        Runs the generations of evolve, scoring on pool if given
+        """
         for gen in range(self.generations):
             # evaluate fitness
-            fitness_scores = []
-            for chromosome in population:
-                fitness = self.fitness_function(chromosome)
-                chromosome.fitness = fitness
-                fitness_scores.append(fitness)
+            fitness_scores = self.evaluate_population(population, pool)
 
             gen_best_idx = np.argmax(fitness_scores)
             gen_best_fitness = fitness_scores[gen_best_idx]
@@ -453,18 +939,22 @@ class EvolutionEngine:
                 self.best_fitness_ever = gen_best_fitness
                 self.best_ever = gen_best.clone()
 
+            # diversity is the spread of fitness scores, computed once for both history and the progress line
+            avg_fitness = np.mean(fitness_scores)
+            diversity = np.std(fitness_scores)
+
             self.history.append({
                 'generation': gen,
                 'best_fitness': gen_best_fitness,
-                'avg_fitness': np.mean(fitness_scores),
+                'avg_fitness': avg_fitness,
                 'best_roster': gen_best,
-                'diversity': np.std(fitness_scores)
+                'diversity': diversity
             })
 
             if gen % 10 == 0 or gen == self.generations - 1:
                 print(f"Gen {gen:3d}: Best={gen_best_fitness:.4f},"
-                      f"Avg={np.mean(fitness_scores):.4f},"
-                      f"Diversity={np.std(fitness_scores):.4f}")
+                      f"Avg={avg_fitness:.4f},"
+                      f"Diversity={diversity:.4f}")
                 
             # create next population
             next_population = []
@@ -474,15 +964,32 @@ class EvolutionEngine:
             for i in range(self.elitism_count):
                 next_population.append(population[sorted_indices[i]].clone())
 
+            # pre-draw this generation's tournaments, crossover and mutation decisions in bulk
+            fit = np.asarray(fitness_scores)
+            n_draws = self.population_size
+            parents = self.tournament_winners(fit, n_draws)
+            crossover_draws = self.rng.random((n_draws, 1 + NUM_POS))
+            mutation_draws = self.rng.random((n_draws, 2, 2))
+            row = 0
+
             while len(next_population) < self.population_size:
-                parent1 = self.tournament_selection(population, fitness_scores)
-                parent2 = self.tournament_selection(population, fitness_scores)
+                if row == n_draws: # many invalid children, draw another block
+                    parents = self.tournament_winners(fit, n_draws)
+                    crossover_draws = self.rng.random((n_draws, 1 + NUM_POS))
+                    mutation_draws = self.rng.random((n_draws, 2, 2))
+                    row = 0
+
+                parent1 = population[parents[row, 0]]
+                parent2 = population[parents[row, 1]]
 
                 # crossover
-                child1, child2 = self.crossover(parent1, parent2)
+                child1, child2 = self.crossover(parent1, parent2, crossover_draws[row])
+                child1 = self._repair(child1)
+                child2 = self._repair(child2)
 
-                child1 = self.mutate(child1)
-                child2 = self.mutate(child2)
+                child1 = self.mutate(child1, mutation_draws[row, 0])
+                child2 = self.mutate(child2, mutation_draws[row, 1])
+                row += 1
 
                 # check validity and then add to next generation if valid
                 if child1.is_valid(self.constraints):
@@ -491,11 +998,6 @@ class EvolutionEngine:
                     next_population.append(child2)
 
             population = next_population[:self.population_size]
-
-        print(f"Praise Darwin! Evolution Complete")
-        print(f"Best fitness achieved: {self.best_fitness_ever:.4f}")
-
-        return self.best_ever, self.history
             
 
 
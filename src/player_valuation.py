@@ -1,9 +1,42 @@
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import math
+import multiprocessing
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+from dataclasses import MISSING, dataclass, fields
+from functools import cached_property, lru_cache
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
 
-@dataclass
+try:
+    from numba import njit, prange
+except ImportError: # numba is optional, kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        return lambda func: func
+    prange = range
+
+try:
+    import numexpr as ne
+except ImportError: # numexpr is optional, batch valuation falls back to NumPy
+    ne = None
+
+NUMEXPR_MIN_ROWS = 10_000 # below this numexpr's setup costs more than the temporaries it saves
+
+# Start method for worker process pools. Forking after numba's parallel kernels have started their
+# thread pool deadlocks the children, spawned workers start clean
+MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Canonical position order, integer position codes index into this list.
+# Unknown positions get code NUM_POS, whose lookup table slot holds the default values
+POSITIONS = tuple(sys.intern(p) for p in ('QB', 'RB', 'WR', 'TE', 'OT', 'OG', 'C', 'EDGE', 'DL', 'LB', 'CB', 'S', 'K', 'P', 'LS'))
+POS_INDEX = {p: i for i, p in enumerate(POSITIONS)}
+NUM_POS = len(POSITIONS)
+
+@dataclass(slots=True) # no per-instance __dict__, smaller players and faster attribute reads
 class PlayerAsset:
     """
     Representing a player as a financial asset for roster optimization.
@@ -34,15 +67,224 @@ class PlayerAsset:
     efficiency_ratio: float = 0.0
     sharpe_ratio: float = 0.0
 
+    def __post_init__(self):
+        # interned so the position table lookups hit dict keys by identity, positions read from files are fresh strings.
+        # missing positions (None / NaN from scraped data) are left as is and valued as unknown positions
+        if isinstance(self.position, str):
+            self.position = sys.intern(self.position)
+
+    @classmethod
+    def from_columns(cls, **columns) -> List['PlayerAsset']:
+        """
+        Builds one player per row of equal-length columns keyed by field name, NumPy arrays included
+
+        Skips __init__ and writes each field's slot for the whole batch at once,
+        calculated fields left out keep their 0.0 defaults
+
+        Output is a list of player assets
+        """
+        init_fields = [f for f in fields(cls) if f.init]
+
+        unknown = set(columns) - {f.name for f in init_fields}
+        if unknown:
+            raise TypeError(f"from_columns() got unknown columns: {', '.join(sorted(unknown))}")
+        missing = [f.name for f in init_fields if f.default is MISSING and f.name not in columns]
+        if missing:
+            raise TypeError(f"from_columns() missing columns: {', '.join(missing)}")
+
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("from_columns() columns must all be the same length")
+
+        players = [object.__new__(cls) for _ in range(lengths.pop())]
+
+        for f in init_fields:
+            set_slot = getattr(cls, f.name).__set__
+            if f.name in columns:
+                col = columns[f.name]
+                for p, value in zip(players, col.tolist() if isinstance(col, np.ndarray) else col):
+                    set_slot(p, value)
+            else:
+                for p in players:
+                    set_slot(p, f.default)
+
+        # what __post_init__ would have done
+        for p in players:
+            if isinstance(p.position, str):
+                p.position = sys.intern(p.position)
+
+        return players
+
+
+# Whole-league Structure of Arrays: one structured NumPy record per player, fields in PlayerAsset's order.
+# PlayerAsset stays the single-player API, players_to_records / records_to_players convert between the two.
+# String widths are minimums, players_to_records widens them to the longest value so nothing is truncated
+PLAYER_DTYPE = np.dtype([
+    ('player_id', 'U16'),
+    ('name', 'U64'),
+    ('position', 'U4'),
+    ('team', 'U4'),
+    ('age', 'f8'), # fractional and missing (NaN) ages are valid
+    ('cap_hit_2026', 'f8'),
+    ('years_remaining', 'i2'),
+    ('guaranteed_money', 'f8'),
+    ('total_contract_value', 'f8'),
+    ('epa_total', 'f8'),
+    ('snaps_played', 'i4'),
+    ('games_missed', 'i2'),
+    ('expected_value', 'f8'),
+    ('risk_score', 'f8'),
+    ('fair_value', 'f8'),
+    ('efficiency_ratio', 'f8'),
+    ('sharpe_ratio', 'f8'),
+])
+
+def players_to_records(players: List[PlayerAsset]) -> np.ndarray:
+    """
+    Packs players into a PLAYER_DTYPE structured array, string fields widened to fit the longest value
+    """
+    columns = {name: [getattr(p, name) for p in players] for name in PLAYER_DTYPE.names}
+
+    dtype = []
+    for name in PLAYER_DTYPE.names:
+        field_dtype = PLAYER_DTYPE.fields[name][0]
+        if field_dtype.kind == 'U':
+            width = max((len(str(v)) for v in columns[name]), default=0)
+            field_dtype = np.dtype(f'U{max(width, field_dtype.itemsize // 4)}')
+        dtype.append((name, field_dtype))
+
+    records = np.empty(len(players), dtype=dtype)
+    for name, column in columns.items():
+        records[name] = column
+    return records
+
+def records_to_players(records: np.ndarray) -> List[PlayerAsset]:
+    """
+    Unpacks a PLAYER_DTYPE structured array into PlayerAssets, calculated fields included
+    """
+    return PlayerAsset.from_columns(**{name: records[name] for name in PLAYER_DTYPE.names})
+
+
+# Scalar valuation kernels, same math as the PlayerValuationModel methods but over primitives
+# and position lookup tables so numba can compile them
+
+@njit(cache=True)
+def _ev_kernel(pos_code, epa, snaps, base_arr, epa_arr):
+    snap_factor = min(snaps / 1_000, 1.5)
+    return max((base_arr[pos_code] + epa * epa_arr[pos_code]) * snap_factor, 0.0)
+
+@njit(cache=True)
+def _risk_kernel(pos_code, age, games_missed, peak_arr, posrisk_arr):
+    injury_risk = min(games_missed / 51, 0.5)
+
+    age_diff = age - peak_arr[pos_code]
+    if age_diff <= 0:
+        age_risk = 0.0
+    elif age_diff <= 2:
+        age_risk = 0.1
+    elif age_diff <= 4:
+        age_risk = 0.3
+    else:
+        age_risk = 0.5
+
+    return 0.4*injury_risk + 0.4*age_risk + 0.2*posrisk_arr[pos_code]
+
+@njit(cache=True)
+def _npv_kernel(rate, years, ev, cap, risk):
+    discount_rate = rate + risk * .10
+    annual_net = ev / max(years, 1) - cap
+    years = max(years, 0)
+
+    if discount_rate == 0:
+        return annual_net * years
+
+    return annual_net * (1 - (1 + discount_rate) ** -years) * (1 + discount_rate) / discount_rate
+
+@njit(parallel=True, cache=True)
+def _value_roster_kernel(pos_code, age, cap_hit, epa, snaps, games_missed,
+                         base_arr, epa_arr, peak_arr, posrisk_arr):
+    n = len(pos_code)
+    expected_value = np.empty(n)
+    risk_score = np.empty(n)
+    fair_value = np.empty(n)
+    efficiency_ratio = np.zeros(n)
+    sharpe_ratio = np.zeros(n)
+
+    for i in prange(n):
+        ev = _ev_kernel(pos_code[i], epa[i], snaps[i], base_arr, epa_arr)
+        risk = _risk_kernel(pos_code[i], age[i], games_missed[i], peak_arr, posrisk_arr)
+        cap = cap_hit[i]
+
+        expected_value[i] = ev
+        risk_score[i] = risk
+        fair_value[i] = ev * (1 - risk)
+        if cap > 0:
+            efficiency_ratio[i] = ev / cap
+            if risk > 0:
+                sharpe_ratio[i] = (ev - cap) / (risk * cap)
+
+    return expected_value, risk_score, fair_value, efficiency_ratio, sharpe_ratio
+
+@njit(parallel=True, cache=True)
+def _npv_roster_kernel(rate, years, expected_value, cap_hit, risk_score):
+    n = len(years)
+    npv = np.empty(n)
+    for i in prange(n):
+        npv[i] = _npv_kernel(rate, years[i], expected_value[i], cap_hit[i], risk_score[i])
+    return npv
+
+class _PositionTable:
+    """
+    Position keyed table of PlayerValuationModel, read-only so it can't drift from its lookup array
+
+    Assigning a new table (any mapping) stores a read-only copy, rebuilds the lookup array in arr_name,
+    which the vectorized and numba valuation paths index by position code, and clears the model's memos
+    """
+
+    def __init__(self, arr_name: str, default: float):
+        self.arr_name = arr_name
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.key = '_' + name
+
+    def __get__(self, model, owner=None):
+        return self if model is None else model.__dict__[self.key]
+
+    def __set__(self, model, table):
+        table = MappingProxyType(dict(table))
+        model.__dict__[self.key] = table
+        model.__dict__[self.arr_name] = model._position_table(table, self.default)
+        model._clear_memos()
+
 class PlayerValuationModel:
     """
     Pricing theory based on bond pricing and portfolio theory
+
+    The position tables (position_baselines, epa_to_dollars, peak_ages, position_risk) are read-only,
+    assign a whole new table to change one
     """
 
+    EV_CACHE_SIZE = 65_536
+    VALUE_CACHE_SIZE = 65_536
+
+    position_baselines = _PositionTable('_baseline_arr', 10_000_000)
+    epa_to_dollars = _PositionTable('_epa_arr', 1_000_000)
+    peak_ages = _PositionTable('_peak_arr', 27)
+    position_risk = _PositionTable('_pos_risk_arr', 0.2)
+    _TABLE_KEYS = ('_position_baselines', '_epa_to_dollars', '_peak_ages', '_position_risk')
+
     def __init__(self, risk_free_rate: float = 0.03):
         """
         Risk free rate assumption of 0.03 set as default value, can be overwritten when creating new instance
         """
+        self.risk_free_rate = risk_free_rate
+
+        self._memoize_expected_value()
+
+        # value_roster results by player_id: (valuation inputs, (ev, risk, fair value, efficiency, sharpe)),
+        # bounded LRU of VALUE_CACHE_SIZE players
+        self._value_cache: OrderedDict = OrderedDict()
 
         self.position_baselines = {
             "QB": 35_000_000,
@@ -98,6 +340,66 @@ class PlayerValuationModel:
             "LS": 30
         }
 
+        self.position_risk = {
+            "QB": 0.1,
+            "WR": 0.2,
+            "RB": 0.4,
+            "TE": 0.2,
+            "OT": 0.15,
+            "OG": 0.15,
+            "C": 0.15,
+            "EDGE": 0.25,
+            "DL": 0.25,
+            "LB": 0.2,
+            "CB": 0.2,
+            "S": 0.2,
+            "K": 0.1,
+            "P": 0.1,
+            "LS": 0.1
+        }
+
+        # age risk step function indexed by years past peak, rounded up and clipped to [0, 5]:
+        # at/under peak 0.0, 1-2 years 0.1, 3-4 years 0.3, 5+ years 0.5
+        self._age_risk_lut = (0.0, 0.1, 0.1, 0.3, 0.3, 0.5)
+        self._age_risk_arr = np.array(self._age_risk_lut, dtype=np.float64)
+
+    def _memoize_expected_value(self):
+        """
+        Scenario and Monte Carlo rosters repeat the same (position, epa, snaps) inputs, cache their expected values.
+        Keys are the exact inputs, so cached values match the uncached math.
+        Keys don't cover the position tables, their assignment clears the memos instead, see _clear_memos
+        """
+        self._expected_value = lru_cache(maxsize=self.EV_CACHE_SIZE)(self._expected_value)
+
+    def _clear_memos(self):
+        """
+        Drops the expected value and value_roster memos, whose results depend on the position tables.
+        The tables are read-only, so assigning a new one is the only way they change
+        """
+        self._expected_value.cache_clear()
+        self._value_cache.clear()
+
+    def __getstate__(self):
+        # the memo wraps a bound method and doesn't pickle, workers rebuild their own
+        state = self.__dict__.copy()
+        del state['_expected_value']
+        for name in self._TABLE_KEYS:
+            state[name] = dict(state[name]) # mappingproxy doesn't pickle, __setstate__ wraps them again
+        state['_value_cache'] = OrderedDict() # workers only run _value_arrays, no need to ship the roster memo
+        return state
+
+    def __setstate__(self, state):
+        for name in self._TABLE_KEYS:
+            state[name] = MappingProxyType(state[name])
+        self.__dict__.update(state)
+        self._memoize_expected_value()
+
+    def _position_table(self, table: Dict[str, float], default: float) -> np.ndarray:
+        """
+        Lookup array for a position table, indexed by position code (POS_INDEX, NUM_POS for unknown positions)
+        """
+        return np.array([table.get(p, default) for p in POSITIONS] + [default], dtype=np.float64)
+
     def calculate_expected_value(self, player: PlayerAsset) -> float:
         """
         Calculates expected performance value using assumptions established above
@@ -118,13 +420,19 @@ class PlayerValuationModel:
         TypeError
         """
 
-        base_value = self.position_baselines.get(player.position, 10_000_000)
+        return self._expected_value(player.position, player.epa_total, player.snaps_played)
+
+    def _expected_value(self, position: str, epa_total: float, snaps_played: int) -> float:
+        """
+        calculate_expected_value on its three inputs, memoized per model in __init__
+        """
+        base_value = self.position_baselines.get(position, 10_000_000)
 
-        epa_value = player.epa_total * self.epa_to_dollars.get(player.position, 1_000_000)
+        epa_value = epa_total * self.epa_to_dollars.get(position, 1_000_000)
 
         expected_plays = 1_000 # approximate number of plays in a 17-game season
 
-        snap_factor = min(player.snaps_played / expected_plays, 1.5) # capping at 150%
+        snap_factor = min(snaps_played / expected_plays, 1.5) # capping at 150%
 
         # calculating raw performance value
         performance_value = base_value + epa_value
@@ -154,50 +462,23 @@ class PlayerValuationModel:
 
         
         """
-        risk_components = []
-
         injury_risk = min(player.games_missed / 51, 0.5) # 51 for 3 full regular seasons
-        risk_components.append(injury_risk)
 
         peak_age = self.peak_ages.get(player.position, 27) # simplifying assumption of player peak at 27 years due to avg NFL career being ~5 seasons
         age_diff = player.age - peak_age
 
-        if age_diff <= 0:
-            age_risk = 0.0
-        elif age_diff <= 2:
-            age_risk = 0.1
-        elif age_diff <= 4:
-            age_risk = 0.3
-        else:
-            age_risk = 0.5
+        if math.isfinite(age_diff):
+            age_risk = self._age_risk_lut[min(max(math.ceil(age_diff), 0), 5)]
+        else: # missing (NaN) ages fall in the oldest bracket
+            age_risk = 0.0 if age_diff < 0 else 0.5
 
-        risk_components.append(age_risk)
-
-        position_risk = {
-            "QB": 0.1,
-            "WR": 0.2,
-            "RB": 0.4,
-            "TE": 0.2,
-            "OT": 0.15,
-            "OG": 0.15,
-            "C": 0.15,
-            "EDGE": 0.25,
-            "DL": 0.25,
-            "LB": 0.2,
-            "CB": 0.2,
-            "S": 0.2,
-            "K": 0.1,
-            "P": 0.1,
-            "LS": 0.1
-        }
-
-        risk_components.append(position_risk.get(player.position, 0.2))
+        position_risk = self.position_risk.get(player.position, 0.2)
 
         # combined risk scores 
         total_risk = (
-            0.4*risk_components[0] +
-            0.4*risk_components[1] +
-            0.2*risk_components[2]
+            0.4*injury_risk +
+            0.4*age_risk +
+            0.2*position_risk
         )
 
         return total_risk
@@ -220,12 +501,36 @@ class PlayerValuationModel:
         annual_cost = player.cap_hit_2026
         annual_net = annual_value-annual_cost
 
-        npv = 0
+        if annual_net == 0:
+            return 0.0
+
+        # year 0 is undiscounted, so this is the present value of an annuity-due:
+        # sum(annual_net / (1+r)**year for year in range(n))
+        years = max(player.years_remaining, 0)
+
+        if discount_rate == 0:
+            return annual_net * years
 
-        for year in range(player.years_remaining):
-            npv += annual_net / ((1 + discount_rate) ** year)
+        r = discount_rate
+        return annual_net * (1 - (1 + r) ** -years) * (1 + r) / r
 
-        return npv
+    def calculate_npv_vec(self, years: np.ndarray, annual_net: np.ndarray, discount_rate: np.ndarray) -> np.ndarray:
+        """
+        calculate_npv's annuity-due formula over whole-roster arrays
+
+        years: np.ndarray of years remaining
+        annual_net: np.ndarray of annual value minus annual cost
+        discount_rate: np.ndarray of per-player discount rates
+
+        Returns np.ndarray of NPVs
+        """
+        years = np.maximum(years, 0)
+        r = np.asarray(discount_rate, dtype=np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            annuity = (1 - (1 + r) ** -years) * (1 + r) / r
+
+        return np.where(r == 0, annual_net * years, annual_net * annuity)
 
     def calculate_fair_value(self, player: PlayerAsset) -> float:
         """
@@ -274,7 +579,7 @@ class PlayerValuationModel:
         :rtype: float
         """
 
-        if player.risk_score <= 0:
+        if player.risk_score <= 0 or player.cap_hit_2026 <= 0:
             return 0.0
         
         excess_return = (player.expected_value - player.cap_hit_2026)
@@ -285,11 +590,23 @@ class PlayerValuationModel:
         """
         Complete valuation of a player from previous methods
         """
-        player.expected_value = self.calculate_expected_value(player)
         player.risk_score = self.calculate_risk_score(player)
-        player.fair_value = self.calculate_fair_value(player)
-        player.efficiency_ratio = self.calculate_efficiency_ratio(player)
-        player.sharpe_ratio = self.calculate_sharpe_ratio(player)
+
+        # no snaps means no expected value, and so no fair value either
+        if player.snaps_played == 0:
+            player.expected_value = 0.0
+            player.fair_value = 0.0
+        else:
+            player.expected_value = self.calculate_expected_value(player)
+            player.fair_value = self.calculate_fair_value(player)
+
+        # both ratios divide by the cap hit, zero for practice squad / unsigned players like value_roster
+        if player.cap_hit_2026 <= 0:
+            player.efficiency_ratio = 0.0
+            player.sharpe_ratio = 0.0
+        else:
+            player.efficiency_ratio = self.calculate_efficiency_ratio(player)
+            player.sharpe_ratio = self.calculate_sharpe_ratio(player)
 
         return player
     
@@ -297,99 +614,429 @@ class PlayerValuationModel:
         """
         Values an entire roster of inputs
 
+        Same math as value_player, but computed as whole-roster NumPy array operations
+        and written back onto the players in one pass.
+        Players already valued by this model with unchanged inputs are filled from the memo by player_id
+
+        Output is a list of player assets
+        """
+        if not players:
+            return []
+
+        cache = self._value_cache
+        todo = []
+        for p in players:
+            cached = cache.get(p.player_id)
+            if cached is not None and cached[0] == self._value_key(p):
+                cache.move_to_end(p.player_id)
+                (p.expected_value, p.risk_score, p.fair_value,
+                 p.efficiency_ratio, p.sharpe_ratio) = cached[1]
+            else:
+                todo.append(p)
+
+        if todo:
+            self._write_back(todo, *self._value_arrays(todo))
+            for p in todo:
+                cache[p.player_id] = (
+                    self._value_key(p),
+                    (p.expected_value, p.risk_score, p.fair_value, p.efficiency_ratio, p.sharpe_ratio),
+                )
+                cache.move_to_end(p.player_id)
+            while len(cache) > self.VALUE_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return list(players)
+
+    @staticmethod
+    def _value_key(player: PlayerAsset) -> tuple:
+        """
+        The fields valuation reads, a memoized result is only reused while these match.
+        NaN (missing) values become None, a NaN never compares equal to itself
+        """
+        return tuple(None if v != v else v for v in (
+            player.position, player.age, player.cap_hit_2026, player.epa_total,
+            player.snaps_played, player.games_missed
+        ))
+
+    def value_and_analyze(self, players: List[PlayerAsset], backend: str = "pandas") -> Tuple[List[PlayerAsset], Dict]:
+        """
+        Values an entire roster and reports on it as a portfolio in one go
+
+        Same as value_roster followed by PortfolioAnalyzer(...).summary_report(), but the analyzer is built
+        from the valuation's own arrays instead of reading every player back
+
+        Output is the list of player assets and the summary report
+        """
+        position_code, age, cap_hit, epa, snaps, games_missed = self._roster_arrays(players)
+        expected_value, risk_score, fair_value, efficiency_ratio, sharpe_ratio = self._value_columns(
+            position_code, age, cap_hit, epa, snaps, games_missed
+        )
+        self._write_back(players, expected_value, risk_score, fair_value, efficiency_ratio, sharpe_ratio)
+
+        analyzer = PortfolioAnalyzer(players, backend=backend, columns={
+            'age': age,
+            'cap_hit': cap_hit,
+            'expected_value': expected_value,
+            'fair_value': fair_value,
+            'risk_score': risk_score,
+            'efficiency_ratio': efficiency_ratio,
+            'sharpe_ratio': sharpe_ratio,
+        })
+
+        return list(players), analyzer.summary_report()
+
+    def value_roster_parallel(self, players: List[PlayerAsset], n_workers: Optional[int] = None,
+                              min_chunk_size: int = 500) -> List[PlayerAsset]:
+        """
+        Values an entire roster of inputs
+
+        Same as value_roster, with the roster split into chunks valued in worker processes.
+        Meant for league-wide player lists, rosters too small to give every worker min_chunk_size players
+        use fewer workers, and run in process when that leaves one
+
+        n_workers defaults to os.cpu_count()
+
         Output is a list of player assets
         """
+        if not players:
+            return []
+
+        n_workers = min(n_workers or os.cpu_count() or 1, len(players) // min_chunk_size)
+        if n_workers <= 1:
+            return self.value_roster(players)
+
+        chunks = [players[i::n_workers] for i in range(n_workers)]
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=MP_CONTEXT) as pool:
+            results = list(pool.map(_value_chunk, repeat(self), chunks))
+
+        # workers valued copies of the players, write their results back onto the originals
+        for chunk, arrays in zip(chunks, results):
+            self._write_back(chunk, *arrays)
+
+        return list(players)
+
+    def value_records(self, records: np.ndarray) -> np.ndarray:
+        """
+        Values a PLAYER_DTYPE structured array in place, same math as value_roster on the record fields
+
+        Output is the valued records
+        """
+        position_code = np.fromiter((POS_INDEX.get(p, NUM_POS) for p in records['position'].tolist()),
+                                    dtype=np.intp, count=len(records))
+
+        (records['expected_value'], records['risk_score'], records['fair_value'],
+         records['efficiency_ratio'], records['sharpe_ratio']) = self._value_columns(
+            position_code,
+            records['age'].astype(np.float64),
+            records['cap_hit_2026'],
+            records['epa_total'],
+            records['snaps_played'].astype(np.float64),
+            records['games_missed'].astype(np.float64),
+        )
+
+        return records
+
+    def _value_arrays(self, players: List[PlayerAsset]) -> tuple:
+        """
+        value_roster's whole-roster math, returns the expected value, risk score, fair value,
+        efficiency ratio and sharpe ratio arrays without touching the players
+        """
+        return self._value_columns(*self._roster_arrays(players))
+
+    def _value_columns(self, position_code: np.ndarray, age: np.ndarray, cap_hit: np.ndarray, epa: np.ndarray,
+                       snaps: np.ndarray, games_missed: np.ndarray) -> tuple:
+        """
+        _value_arrays on the input columns
+        """
+
+        # position lookups, same defaults as the scalar methods
+        base_value = self._baseline_arr[position_code]
+        epa_dollars = self._epa_arr[position_code]
+        peak_age = self._peak_arr[position_code]
+        position_risk = self._pos_risk_arr[position_code]
+
+        # expected value
+        snap_factor = np.minimum(snaps / 1_000, 1.5)
+        expected_value = np.maximum((base_value + epa * epa_dollars) * snap_factor, 0)
+
+        # risk score
+        injury_risk = np.minimum(games_missed / 51, 0.5)
+        age_diff = age - peak_age
+        age_risk = self._age_risk_arr[np.clip(np.nan_to_num(np.ceil(age_diff), nan=5), 0, 5).astype(np.intp)] # NaN ages in the oldest bracket
+        risk_score = 0.4*injury_risk + 0.4*age_risk + 0.2*position_risk
+
+        # fair value, efficiency and sharpe, zero where the scalar methods return 0.0
+        if ne is not None and len(expected_value) >= NUMEXPR_MIN_ROWS:
+            # one fused, multi-threaded pass per expression, no intermediate arrays
+            local_dict = {'ev': expected_value, 'rs': risk_score, 'cap': cap_hit}
+            fair_value = ne.evaluate("ev * (1 - rs)", local_dict=local_dict)
+            efficiency_ratio = ne.evaluate("where(cap > 0, ev / cap, 0.0)", local_dict=local_dict)
+            sharpe_ratio = ne.evaluate("where((rs > 0) & (cap > 0), (ev - cap) / (rs * cap), 0.0)", local_dict=local_dict)
+            return expected_value, risk_score, fair_value, efficiency_ratio, sharpe_ratio
+
+        fair_value = expected_value * (1 - risk_score)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            efficiency_ratio = np.where(cap_hit > 0, expected_value / cap_hit, 0.0)
+            sharpe_ratio = np.where((risk_score > 0) & (cap_hit > 0), (expected_value - cap_hit) / (risk_score * cap_hit), 0.0)
+
+        return expected_value, risk_score, fair_value, efficiency_ratio, sharpe_ratio
+
+    def value_roster_numba(self, players: List[PlayerAsset]) -> List[PlayerAsset]:
+        """
+        Values an entire roster of inputs
+
+        Same math as value_player, run through the numba kernels with the roster loop spread across cores.
+        Without numba installed the kernels run as plain Python, so prefer value_roster there
+
+        Output is a list of player assets
+        """
+        if not players:
+            return []
+
+        position_code, age, cap_hit, epa, snaps, games_missed = self._roster_arrays(players)
+        results = _value_roster_kernel(position_code, age, cap_hit, epa, snaps, games_missed,
+                                       self._baseline_arr, self._epa_arr, self._peak_arr, self._pos_risk_arr)
+        self._write_back(players, *results)
+
+        return list(players)
+
+    def npv_roster_numba(self, players: List[PlayerAsset]) -> np.ndarray:
+        """
+        calculate_npv for every player through the numba kernels, players should already be valued
+
+        Returns np.ndarray of NPVs in roster order
+        """
+        n = len(players)
+        years = np.fromiter((p.years_remaining for p in players), dtype=np.float64, count=n)
+        expected_value = np.fromiter((p.expected_value for p in players), dtype=np.float64, count=n)
+        cap_hit = np.fromiter((p.cap_hit_2026 for p in players), dtype=np.float64, count=n)
+        risk_score = np.fromiter((p.risk_score for p in players), dtype=np.float64, count=n)
+
+        return _npv_roster_kernel(float(self.risk_free_rate), years, expected_value, cap_hit, risk_score)
+
+    @staticmethod
+    def _roster_arrays(players: List[PlayerAsset]) -> tuple:
+        """
+        Structure of Arrays for the valuation inputs: position code, age, cap hit, EPA, snaps, games missed
+
+        Position codes are looked up from the current position, so reassigned positions are valued as such
+        """
+        n = len(players)
+        position_code = np.fromiter((POS_INDEX.get(p.position, NUM_POS) for p in players), dtype=np.intp, count=n)
+        age = np.fromiter((p.age for p in players), dtype=np.float64, count=n)
+        cap_hit = np.fromiter((p.cap_hit_2026 for p in players), dtype=np.float64, count=n)
+        epa = np.fromiter((p.epa_total for p in players), dtype=np.float64, count=n)
+        snaps = np.fromiter((p.snaps_played for p in players), dtype=np.float64, count=n)
+        games_missed = np.fromiter((p.games_missed for p in players), dtype=np.float64, count=n)
+
+        return position_code, age, cap_hit, epa, snaps, games_missed
+
+    @staticmethod
+    def _write_back(players: List[PlayerAsset], expected_value: np.ndarray, risk_score: np.ndarray,
+                    fair_value: np.ndarray, efficiency_ratio: np.ndarray, sharpe_ratio: np.ndarray) -> None:
+        """
+        Writes the calculated arrays back onto the players as Python floats
+        """
+        for p, ev, rs, fv, er, sr in zip(players, expected_value.tolist(), risk_score.tolist(),
+                                         fair_value.tolist(), efficiency_ratio.tolist(), sharpe_ratio.tolist()):
+            p.expected_value = ev
+            p.risk_score = rs
+            p.fair_value = fv
+            p.efficiency_ratio = er
+            p.sharpe_ratio = sr
+
+
+def _value_chunk(model: PlayerValuationModel, players: List[PlayerAsset]) -> tuple:
+    """
+    Worker side of PlayerValuationModel.value_roster_parallel, module level so it pickles
+    """
+    return model._value_arrays(players)
 
-        return [self.value_player(p) for p in players]
-    
 
 class PortfolioAnalyzer:
     """
     Analyzes entire roster as asset portfolio
+
+    backend: "pandas" (default) or "polars", the DataFrame library self.df and the identify_* results use.
+    polars is optional and only imported when asked for
+    columns: numeric columns already computed for these players (see PlayerValuationModel.value_and_analyze),
+    keyed by DataFrame column name, so only names and positions are read from the players
     """
 
-    def __init__(self, players: List[PlayerAsset]):
-        self.players = players
-        self.df = self._to_dataframe()
+    BACKENDS = ("pandas", "polars")
 
-    def _to_dataframe(self) -> pd.DataFrame:
+    NUMERIC_COLUMNS = ('age', 'cap_hit', 'expected_value', 'fair_value', 'risk_score', 'efficiency_ratio', 'sharpe_ratio')
+
+    def __init__(self, players: List[PlayerAsset], backend: str = "pandas",
+                 columns: Optional[Dict[str, np.ndarray]] = None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {self.BACKENDS}")
+
+        self.players = players
+        self.backend = backend
+        self.df = self._to_dataframe(columns)
+        self._agg = None # portfolio aggregates, see _compute_aggregates
+
+        # rows sorted by position once, each position is then a contiguous run starting at _position_starts.
+        # rows with a missing position are left out, as groupby drops them
+        raw_positions = np.asarray(self.df['position'].to_numpy(), dtype=object)
+        known_rows = np.flatnonzero(~pd.isna(raw_positions))
+        positions = raw_positions[known_rows].astype(str)
+        by_position = np.argsort(positions, kind='stable')
+        self._sort_order = known_rows[by_position]
+        sorted_positions = positions[by_position]
+        self._position_starts = np.flatnonzero(
+            np.r_[True, sorted_positions[1:] != sorted_positions[:-1]]
+        ) if len(positions) else np.empty(0, dtype=np.intp)
+        self._position_keys = sorted_positions[self._position_starts].tolist()
+
+    def _to_dataframe(self, columns: Optional[Dict[str, np.ndarray]] = None):
         """
-        Convert players list to Pandas DataFrame
+        Convert players list to a Pandas (or Polars) DataFrame, numeric columns come from columns when given
         """
-        data = []
+        n = len(self.players)
+
+        # preallocated columns, filled in one pass and handed to pandas without dtype inference
+        name = np.empty(n, dtype=object)
+        position = np.empty(n, dtype=object)
+
+        if columns is not None:
+            for i, p in enumerate(self.players):
+                name[i] = p.name
+                position[i] = p.position
+
+            # age keeps the caller's dtype, fractional and missing (NaN) ages are valid
+            age = np.asarray(columns['age'])
+            cap_hit, expected_value, fair_value, risk_score, efficiency_ratio, sharpe_ratio = (
+                np.asarray(columns[col], dtype=np.float64)
+                for col in self.NUMERIC_COLUMNS if col != 'age'
+            )
+        else:
+            # age is left to dtype inference: int64 for whole years, float64 once any age is fractional or missing
+            age = [None] * n
+            cap_hit = np.empty(n, dtype=np.float64)
+            expected_value = np.empty(n, dtype=np.float64)
+            fair_value = np.empty(n, dtype=np.float64)
+            risk_score = np.empty(n, dtype=np.float64)
+            efficiency_ratio = np.empty(n, dtype=np.float64)
+            sharpe_ratio = np.empty(n, dtype=np.float64)
+
+            for i, p in enumerate(self.players):
+                name[i] = p.name
+                position[i] = p.position
+                age[i] = p.age
+                cap_hit[i] = p.cap_hit_2026
+                expected_value[i] = p.expected_value
+                fair_value[i] = p.fair_value
+                risk_score[i] = p.risk_score
+                efficiency_ratio[i] = p.efficiency_ratio
+                sharpe_ratio[i] = p.sharpe_ratio
+
+        columns = {
+            'name': name,
+            'position': position,
+            'age': age,
+            'cap_hit': cap_hit,
+            'expected_value': expected_value,
+            'fair_value': fair_value,
+            'risk_score': risk_score,
+            'efficiency_ratio': efficiency_ratio,
+            'sharpe_ratio': sharpe_ratio,
+            'npv': expected_value - cap_hit
+        }
+
+        if self.backend == "polars":
+            import polars as pl
 
-        for p in self.players:
-            data.append({
-                'name': p.name,
-                'position': p.position,
-                'age': p.age,
-                'cap_hit': p.cap_hit_2026,
-                'expected_value': p.expected_value,
-                'fair_value': p.fair_value,
-                'risk_score': p.risk_score,
-                'efficiency_ratio': p.efficiency_ratio,
-                'sharpe_ratio': p.sharpe_ratio,
-                'npv': p.expected_value - p.cap_hit_2026
-            })
+            # object arrays would become polars Object columns, hand over the strings as lists
+            columns['name'] = name.tolist()
+            columns['position'] = position.tolist()
+            return pl.DataFrame(columns)
 
-        return pd.DataFrame(data)
+        return pd.DataFrame(columns, copy=False)
     
+    def _compute_aggregates(self) -> Dict[str, float]:
+        """
+        Computes every portfolio level aggregate in one pass over the DataFrame columns, cached in self._agg
+        """
+        if self._agg is None:
+            cap = self.df['cap_hit'].to_numpy()
+            ev = self.df['expected_value'].to_numpy()
+            rs = self.df['risk_score'].to_numpy()
+            fv = self.df['fair_value'].to_numpy()
+
+            total_cost = cap.sum()
+            total_value = ev.sum()
+            risk = float(np.dot(rs, cap)) / total_cost if total_cost != 0 else 0 # cap weighted average risk
+
+            efficiency = total_value / total_cost if total_cost > 0 else 0
+            sharpe = (total_value - total_cost) / (risk * total_cost) if risk != 0 else 0
+
+            self._agg = {
+                "total_value": total_value,
+                "total_cost": total_cost,
+                "efficiency": efficiency,
+                "risk": risk,
+                "sharpe_ratio": sharpe,
+                # default thresholds of identify_overvalued / identify_undervalued
+                "num_overvalued": int(np.count_nonzero(cap > fv * 1.15)),
+                "num_undervalued": int(np.count_nonzero(cap < fv * 0.85)),
+            }
+
+        return self._agg
+
     def total_value(self) -> float:
         """
         Total value of a roster
         """
-        return self.df["expected_value"].sum()
+        return self._compute_aggregates()["total_value"]
     
     def total_cost(self) -> float:
         """
         Total salary cap hit for a roster
         """
-        return self.df["cap_hit"].sum()
+        return self._compute_aggregates()["total_cost"]
 
     def portfolio_efficiency(self) -> float:
         """
         Overall efficiency ratio
         """
-        return self.total_value() / self.total_cost() if self.total_cost() > 0 else 0
+        return self._compute_aggregates()["efficiency"]
     
     def portfolio_risk(self) -> float:
         """
         Weighted average risk
         """
-        total_cap = self.total_cost()
-
-        if total_cap == 0:
-            return 0
-        
-        weighted_risk = sum(
-            p.risk_score * (p.cap_hit_2026 / total_cap) for p in self.players
-        )
-
-        return weighted_risk
+        return self._compute_aggregates()["risk"]
     
     def portfolio_sharpe(self) -> float:
         """
         Sharpe ratio for roster portfolio
         """
-        excess_return = self.total_value() - self.total_cost()
-        risk = self.portfolio_risk()
-
-        if risk == 0:
-            return 0
-        
-        return excess_return / (risk * self.total_cost())
+        return self._compute_aggregates()["sharpe_ratio"]
     
     def position_allocation(self) -> Dict[str, float]:
         """
         % of cap allocated to each position
 
-        
+        Computed once per analyzer, callers get their own copy of the dict
         """
+        return dict(self._position_allocation)
+
+    @cached_property
+    def _position_allocation(self) -> Dict[str, float]:
         total_cap = self.total_cost()
 
-        position_spending = self.df.groupby("position")['cap_hit'].sum()
+        if not self._position_keys:
+            return {}
 
-        return (position_spending / total_cap * 100).to_dict()
+        cap_sorted = self.df['cap_hit'].to_numpy()[self._sort_order]
+        position_spending = np.add.reduceat(cap_sorted, self._position_starts)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = position_spending / total_cap * 100
+
+        return dict(zip(self._position_keys, pct.tolist()))
     
     def identify_overvalued(self, threshold: float=1.15, desc=True) -> pd.DataFrame:
         """
@@ -397,12 +1044,21 @@ class PortfolioAnalyzer:
 
         Threshold defaulted to 1.15, but can be overwritten with specified value.
         """
-        overvalued = self.df[self.df["cap_hit"] > self.df["fair_value"]*threshold].copy() # make a copy to not impact underlying df
+        if self.backend == "polars":
+            import polars as pl
 
-        overvalued['overvalued_by'] = overvalued["cap_hit"] - overvalued["fair_value"]
-        overvalued["pct_overvalued"] = (
-            (overvalued["cap_hit"] / overvalued["fair_value"] - 1) * 100
-        )
+            return self.df.filter(pl.col('cap_hit') > pl.col('fair_value') * threshold).with_columns(
+                (pl.col('cap_hit') - pl.col('fair_value')).alias('overvalued_by'),
+                ((pl.col('cap_hit') / pl.col('fair_value') - 1) * 100).alias('pct_overvalued'),
+            ).sort('overvalued_by', descending=desc)
+
+        cap = self.df['cap_hit'].to_numpy()
+        fv = self.df['fair_value'].to_numpy()
+        idx = np.flatnonzero(cap > fv * threshold)
+
+        cap, fv = cap[idx], fv[idx]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overvalued = self._rows(idx, overvalued_by=cap - fv, pct_overvalued=(cap / fv - 1) * 100)
 
         return overvalued.sort_values(by="overvalued_by", ascending=not desc)
     
@@ -412,41 +1068,50 @@ class PortfolioAnalyzer:
 
         Threshold defaulted to 0.85
         """
+        if self.backend == "polars":
+            import polars as pl
 
-        undervalued = self.df[self.df['cap_hit'] < self.df['fair_value']*threshold].copy()
+            return self.df.filter(pl.col('cap_hit') < pl.col('fair_value') * threshold).with_columns(
+                (pl.col('fair_value') - pl.col('cap_hit')).alias('undervalued_by'),
+                ((1 - pl.col('cap_hit') / pl.col('fair_value')) * 100).alias('pct_undervalued'),
+            ).sort('undervalued_by', descending=desc)
 
-        undervalued['undervalued_by'] = undervalued['fair_value'] - undervalued['cap_hit'] 
+        cap = self.df['cap_hit'].to_numpy()
+        fv = self.df['fair_value'].to_numpy()
+        idx = np.flatnonzero(cap < fv * threshold)
 
-        undervalued['pct_undervalued'] = (
-            (1 - undervalued['cap_hit'] / undervalued['fair_value']) * 100
-        )
+        cap, fv = cap[idx], fv[idx]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            undervalued = self._rows(idx, undervalued_by=fv - cap, pct_undervalued=(1 - cap / fv) * 100)
 
         return undervalued.sort_values(by='undervalued_by', ascending=not desc)
+
+    def _rows(self, idx: np.ndarray, **computed: np.ndarray) -> pd.DataFrame:
+        """
+        Fresh DataFrame of just the rows at idx, gathered column by column instead of copying a filtered slice.
+        Keeps self.df's row labels, computed columns (aligned with idx) are appended in the same construction
+        """
+        rows = self.df.index[idx]
+        columns = {col: self.df[col].take(idx) for col in self.df.columns}
+        columns.update({col: pd.Series(values, index=rows) for col, values in computed.items()})
+
+        return pd.DataFrame(columns, copy=False)
     
     def summary_report(self) -> Dict:
         """
         Complete summary report of portfolio
         """
+        agg = self._compute_aggregates()
+
         return {
-            "total_value": self.total_value(),
-            "total_cost": self.total_cost(),
-            "efficiency": self.portfolio_efficiency(),
-            "risk": self.portfolio_risk(),
-            "sharpe_ratio": self.portfolio_sharpe(),
+            "total_value": agg["total_value"],
+            "total_cost": agg["total_cost"],
+            "efficiency": agg["efficiency"],
+            "risk": agg["risk"],
+            "sharpe_ratio": agg["sharpe_ratio"],
             "position_allocation": self.position_allocation(),
-            "num_overvalued": len(self.identify_overvalued()),
-            "num_undervalued": len(self.identify_undervalued()),
+            "num_overvalued": agg["num_overvalued"],
+            "num_undervalued": agg["num_undervalued"],
             "avg_roster_age": self.df["age"].mean(),
             "total_players": len(self.players)
         }
-
-
-if __name__ == "__main__":
-    main()
-
-
-
-
-
-
-
@@ -1,3 +1,5 @@
+import sys
+
 import player_valuation as pev
 
 # if pev.PlayerAsset:
@@ -60,48 +62,50 @@ valued_roster = model.value_roster(test_roster)
 
 analyzer = pev.PortfolioAnalyzer(valued_roster)
 
-print("IND COLTS - Sample Roster Valuation")
+# report is collected line by line and written once at the end
+lines = ["IND COLTS - Sample Roster Valuation"]
 
 for player in valued_roster:
     # print(player)
-    print(f"\n{player.name} ({player.position}, Age: {player.age})")
-    print(f"\nCap Hit: ${player.cap_hit_2026:>12,.0f}")
-    print(f"\nFair Value: ${player.fair_value:>12,.0f}")
-    print(f"\nDifference: ${player.cap_hit_2026 - player.fair_value:>12,.0f}")
-    print(f"\nEfficiency: {player.efficiency_ratio:>12.2f}")
-    print(f"\nRisk Score: {player.risk_score:>12.2f}")
+    lines.append(f"\n{player.name} ({player.position}, Age: {player.age})")
+    lines.append(f"\nCap Hit: ${player.cap_hit_2026:>12,.0f}")
+    lines.append(f"\nFair Value: ${player.fair_value:>12,.0f}")
+    lines.append(f"\nDifference: ${player.cap_hit_2026 - player.fair_value:>12,.0f}")
+    lines.append(f"\nEfficiency: {player.efficiency_ratio:>12.2f}")
+    lines.append(f"\nRisk Score: {player.risk_score:>12.2f}")
 
     if player.cap_hit_2026 > player.fair_value * 1.15:
         pct_over = ((player.cap_hit_2026 / player.fair_value) - 1) * 100
-        print(f"Overvalued by: {pct_over:.1f}%")
+        lines.append(f"Overvalued by: {pct_over:.1f}%")
     elif player.cap_hit_2026 < player.fair_value * 0.85:
         pct_under = ((player.fair_value / player.cap_hit_2026) - 1) * 100
-        print(f"Undervalued by: {pct_under:.1f}%")
+        lines.append(f"Undervalued by: {pct_under:.1f}%")
 
-print("\n" + "="*50)
-print("PORTFOLIO SUMMARY")
-print("="*50)
+lines.append("\n" + "="*50)
+lines.append("PORTFOLIO SUMMARY")
+lines.append("="*50)
 
 summary = analyzer.summary_report()
 
-print(f"\nTotal Value: ${summary['total_value']:>12,.0f}")
-print(f"\nTotal Cost: ${summary['total_cost']:>12,.0f}")
-print(f"\nEfficiency: {summary['efficiency']:>12.2%}")
-print(f"\nPorfolio Risk: {summary['risk']:>12.2f}")
-print(f"\nSharpe Ratio: {summary['sharpe_ratio']:>12.2f}")
+lines.append(f"\nTotal Value: ${summary['total_value']:>12,.0f}")
+lines.append(f"\nTotal Cost: ${summary['total_cost']:>12,.0f}")
+lines.append(f"\nEfficiency: {summary['efficiency']:>12.2%}")
+lines.append(f"\nPorfolio Risk: {summary['risk']:>12.2f}")
+lines.append(f"\nSharpe Ratio: {summary['sharpe_ratio']:>12.2f}")
 
-print("\nPosition Allocation")
+lines.append("\nPosition Allocation")
 for pos, pct in sorted(summary['position_allocation'].items()):
-    print(f"{pos:>6}: {pct:>6.1f}%")
+    lines.append(f"{pos:>6}: {pct:>6.1f}%")
 
-print("\n"+"="*50)
-print("OVERVALUED PLAYERS")
-print("="*50)
+lines.append("\n"+"="*50)
+lines.append("OVERVALUED PLAYERS")
+lines.append("="*50)
 
 overvalued = analyzer.identify_overvalued()
 
 if len(overvalued) > 0:
-    print(overvalued[['name', 'position', 'cap_hit', 'fair_value', 'overvalued_by', 'pct_overvalued']])
+    lines.append(str(overvalued[['name', 'position', 'cap_hit', 'fair_value', 'overvalued_by', 'pct_overvalued']]))
 else:
-    print("No significantly overvalued players")
+    lines.append("No significantly overvalued players")
 
+sys.stdout.write("\n".join(lines) + "\n")